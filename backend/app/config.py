@@ -60,63 +60,89 @@
 Application configuration settings loaded from environment variables.
 """
 
-from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseSettings, Field, validator
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
+    """Field names map case-insensitively onto environment variables (e.g. ``STORAGE_DIR``)."""
+
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+
     app_name: str = "PodSummarize Backend"
-    environment: str = Field("development", env="ENVIRONMENT")
+    environment: str = "development"
     api_prefix: str = "/api"
 
-    storage_dir: Path = Field(Path("storage"), env="STORAGE_DIR")
-    temp_dir: Path = Field(Path("storage/temp"), env="TEMP_DIR")
-    results_dir: Path = Field(Path("storage/results"), env="RESULTS_DIR")
+    storage_dir: Path = Path("storage")
+    temp_dir: Path = Path("storage/temp")
+    results_dir: Path = Path("storage/results")
 
     # Whisper / transcription configuration
-    whisper_model: str = Field("medium", env="WHISPER_MODEL")
-    transcription_provider: str = Field(
-        "openai", env="TRANSCRIPTION_PROVIDER"
-    )  # openai | assemblyai | google
-    openai_api_key: Optional[str] = Field(None, env="OPENAI_API_KEY")
-    assembly_ai_key: Optional[str] = Field(None, env="ASSEMBLY_AI_KEY")
-    google_credentials_json: Optional[str] = Field(None, env="GOOGLE_CREDENTIALS_JSON")
+    whisper_model: str = "small"  # model name or CTranslate2 directory; use "medium" for higher accuracy
+    whisper_device: str = "cpu"  # "cuda" or "auto" spreads the model over every visible GPU
+    whisper_compute_type: Optional[str] = None  # defaults to int8 on CPU, float16 otherwise
+    whisper_workers: int = 2  # concurrent decode workers on the shared model
+    whisper_chunk_seconds: int = 30  # target span length when splitting audio on speech
+    whisper_preload: bool = True  # load the model at startup instead of on the first job
+    transcription_provider: str = "openai"  # openai | assemblyai | google
+    openai_api_key: Optional[str] = None
+    assembly_ai_key: Optional[str] = None
+    google_credentials_json: Optional[str] = None
 
     # LLM summarization
-    llm_provider: str = Field("openai", env="LLM_PROVIDER")  # openai | deepseek | gemini | custom
-    llm_model: str = Field("gpt-4o-mini", env="LLM_MODEL")
-    llm_api_key: Optional[str] = Field(None, env="LLM_API_KEY")
-    gemini_api_key: Optional[str] = Field(None, env="GEMINI_API_KEY")
+    llm_provider: str = "openai"  # openai | deepseek | gemini | custom
+    llm_model: str = "gpt-4o-mini"
+    llm_api_key: Optional[str] = None
+    gemini_api_key: Optional[str] = None
+    summary_cache_size: int = 256  # identical transcripts reuse a cached summary; 0 disables
+    llm_concurrency: int = 16  # max in-flight LLM provider calls
+    summary_chunk_chars: int = 12000  # ~3k tokens per map-step prompt; 0 sends the whole transcript at once
+    summary_chunk_overlap_turns: int = 2  # turns repeated at the start of the next chunk for context
 
     # TTS settings (optional)
     # Default provider switched to ElevenLabs to avoid Azure DNS/region issues.
-    tts_provider: str = Field("elevenlabs", env="TTS_PROVIDER")  # azure | google | coqui | elevenlabs | none
-    tts_voice: str = Field("en-US-JennyMultilingualNeural", env="TTS_VOICE")
-    azure_speech_key: Optional[str] = Field(None, env="AZURE_SPEECH_KEY")
-    azure_speech_region: Optional[str] = Field(None, env="AZURE_SPEECH_REGION")
+    tts_provider: str = "elevenlabs"  # azure | google | coqui | elevenlabs | none
+    tts_voice: str = "en-US-JennyMultilingualNeural"
+    azure_speech_key: Optional[str] = None
+    azure_speech_region: Optional[str] = None
+    tts_concurrency: int = 16  # max in-flight TTS provider calls
 
     # --- ElevenLabs (ADDED) ---
-    elevenlabs_api_key: Optional[str] = Field(None, env="ELEVENLABS_API_KEY")
-    elevenlabs_voice: Optional[str] = Field(None, env="ELEVENLABS_VOICE")
+    elevenlabs_api_key: Optional[str] = None
+    elevenlabs_voice: Optional[str] = None
     # ---------------------------
 
-    cors_origins: str = Field("*", env="CORS_ORIGINS")
+    keep_intermediate: bool = False  # also write the pre-diarization transcript.json
+
+    # Job admission: jobs beyond max_concurrent_jobs wait; beyond the queue depth they are refused.
+    max_concurrent_jobs: int = 2
+    max_queued_jobs: int = 8
+    # Finished jobs are dropped from memory after the TTL, or oldest-first past the cap.
+    max_tracked_jobs: int = 1000
+    job_ttl_seconds: int = 24 * 60 * 60
+
+    persist_jobs: bool = True  # snapshot job status under results_dir and reload it on startup
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    cors_origins: str = "*"
 
-    @validator("storage_dir", "temp_dir", "results_dir", pre=True)
+    @field_validator("storage_dir", "temp_dir", "results_dir", mode="before")
+    @classmethod
     def _ensure_path(cls, value: Path) -> Path:
-        path = Path(value)
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return Path(value)
+
+    def ensure_directories(self) -> None:
+        """Create the storage directories if they do not exist yet."""
+        for path in (self.storage_dir, self.temp_dir, self.results_dir):
+            path.mkdir(parents=True, exist_ok=True)
+
+
+# Loaded once at import; modules read attributes from this constant directly.
+SETTINGS: Settings = Settings()
 
 
-@lru_cache()
 def get_settings() -> Settings:
-    """Return cached settings instance."""
-    return Settings()
+    """Return the shared settings instance (kept as a seam for test overrides)."""
+    return SETTINGS
@@ -4,14 +4,16 @@ FastAPI application entry point for PodSummarize.
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 from typing import Optional
 
 from fastapi import BackgroundTasks, FastAPI, File, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
+from pydantic import BaseModel
 
-from .config import Settings, get_settings
+from .config import SETTINGS
 from .models import (
     ProcessRequest,
     ProcessResponse,
@@ -20,27 +22,66 @@ from .models import (
     TTSResponse,
     UploadResponse,
 )
-from .services import pipeline
-from .services.storage import generate_job_id, save_upload
+from .services import pipeline, transcription
+from .services.http_client import close_client, get_client
+from .services.storage import generate_job_id, save_stream, save_upload
 
-app = FastAPI(title="PodSummarize Backend")
+logger = logging.getLogger(__name__)
 
+app = FastAPI(title="PodSummarize Backend", default_response_class=ORJSONResponse)
 
-def configure_cors(app: FastAPI, settings: Settings) -> None:
-    origins = [origin.strip() for origin in settings.cors_origins.split(",") if origin.strip()]
-    if getattr(app.state, "cors_configured", False):
+
+_CORS_ORIGINS = [
+    origin.strip() for origin in SETTINGS.cors_origins.split(",") if origin.strip()
+] or ["*"]
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=_CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
+@app.on_event("startup")
+async def prepare_storage() -> None:
+    SETTINGS.ensure_directories()
+
+
+@app.on_event("startup")
+async def restore_jobs() -> None:
+    if not SETTINGS.persist_jobs:
         return
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=origins if origins else ["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-    app.state.cors_configured = True
+    restored = await pipeline.pipeline_state.restore()
+    if restored:
+        logger.info("Restored %d job(s) from %s", restored, SETTINGS.results_dir)
+
 
+@app.on_event("startup")
+async def preload_whisper() -> None:
+    if not SETTINGS.whisper_preload:
+        return
+    try:
+        await transcription.get_model()
+    except Exception:  # noqa: BLE001
+        # The first job will retry the load and report the error on its status.
+        logger.warning("Whisper model preload failed", exc_info=True)
 
-configure_cors(app, get_settings())
+
+@app.on_event("shutdown")
+async def close_http_client() -> None:
+    await close_client()
+
+
+@app.on_event("shutdown")
+async def flush_job_snapshots() -> None:
+    await pipeline.pipeline_state.flush()
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Encode a model with pydantic-core and skip FastAPI's response re-validation."""
+    return Response(content=model.model_dump_json(), media_type="application/json")
 
 
 def get_audio_file_path(job_id: str, filename: str) -> Path:
@@ -52,7 +93,7 @@ async def upload_podcast(
     background_tasks: BackgroundTasks,
     file: Optional[UploadFile] = File(None),
     podcast_url: Optional[str] = None,
-) -> UploadResponse:
+) -> Response:
     """
     Upload a podcast audio file or provide a public URL for download.
 
@@ -70,57 +111,57 @@ async def upload_podcast(
     else:
         background_tasks.add_task(_download_podcast_audio, job_id, podcast_url)
 
-    return UploadResponse(job_id=job_id, status=status)
+    return _json_response(UploadResponse(job_id=job_id, status=status))
 
 
 async def _download_podcast_audio(job_id: str, podcast_url: str) -> None:
     """Download audio from given URL and store for processing."""
-    import httpx
-
     try:
         if not podcast_url:
             raise ValueError("Podcast URL missing.")
-        async with httpx.AsyncClient(timeout=120) as client:
-            response = await client.get(podcast_url)
+        client = await get_client()
+        async with client.stream("GET", podcast_url) as response:
             response.raise_for_status()
-            audio_bytes = response.content
+            path = await save_stream(job_id, "source.mp3", response.aiter_bytes(64 * 1024))
 
-        path = pipeline.get_job_dir(job_id) / "source.mp3"
-        path.write_bytes(audio_bytes)
         pipeline.register_audio_asset(job_id, str(path))
     except Exception as exc:  # noqa: BLE001
         pipeline.pipeline_state.add_error(job_id, f"Download failed: {exc}")
 
 
 @app.post("/process", response_model=ProcessResponse)
-async def start_processing(request: ProcessRequest, background_tasks: BackgroundTasks) -> ProcessResponse:
+async def start_processing(request: ProcessRequest, background_tasks: BackgroundTasks) -> Response:
     """Trigger transcription, diarization, summarization, and optional TTS."""
     try:
-        job_dir = pipeline.get_job_dir(request.job_id)
+        audio_path = pipeline.get_audio_path(request.job_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Job not found") from exc
 
-    audio_candidates = list(job_dir.glob("source.*"))
-    if not audio_candidates:
+    if audio_path is None:
         raise HTTPException(status_code=400, detail="Audio source not available for processing.")
 
-    audio_path = audio_candidates[0]
-    background_tasks.add_task(pipeline.launch_background, request.job_id, str(audio_path), request.enable_tts)
+    try:
+        pipeline.admit_job(request.job_id)
+    except pipeline.PipelineBusyError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+    background_tasks.add_task(pipeline.launch_background, request.job_id, audio_path, request.enable_tts)
     status = pipeline.ensure_job(request.job_id)
-    return ProcessResponse(job_id=request.job_id, status=status)
+    return _json_response(ProcessResponse(job_id=request.job_id, status=status))
 
 
 @app.get("/results/{job_id}", response_model=ResultsResponse)
-async def fetch_results(job_id: str) -> ResultsResponse:
+async def fetch_results(job_id: str) -> Response:
     """Retrieve processing status, transcript, and summary data."""
     try:
-        return pipeline.pipeline_state.results(job_id)
+        results = await pipeline.pipeline_state.results(job_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Job not found") from exc
+    return _json_response(results)
 
 
 @app.post("/tts", response_model=TTSResponse)
-async def generate_summary_audio(request: TTSRequest) -> TTSResponse:
+async def generate_summary_audio(request: TTSRequest) -> Response:
     """Generate TTS for provided summary text."""
     try:
         pipeline.ensure_job(request.job_id)
@@ -131,17 +172,19 @@ async def generate_summary_audio(request: TTSRequest) -> TTSResponse:
     relative_path = str(summary_audio_path)
     pipeline.pipeline_state.store_summary_audio(request.job_id, relative_path)
 
-    return TTSResponse(job_id=request.job_id, audio_url=relative_path)
+    return _json_response(TTSResponse(job_id=request.job_id, audio_url=relative_path))
 
 
 @app.get("/media/{job_id}/{filename}")
 async def serve_media(job_id: str, filename: str) -> FileResponse:
     """Serve stored media assets."""
     path = get_audio_file_path(job_id, filename)
-    if not path.exists():
-        raise HTTPException(status_code=404, detail="Media file not found.")
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail="Media file not found.") from exc
     media_type = "audio/mpeg" if path.suffix == ".mp3" else "application/octet-stream"
-    return FileResponse(path, media_type=media_type)
+    return FileResponse(path, media_type=media_type, stat_result=stat_result)
 
 
 @app.get("/health")
@@ -5,13 +5,9 @@ Diarization service leveraging the Hoard framework.
 from __future__ import annotations
 
 import asyncio
-from typing import List
-
-try:
-    # Hoard's Python package is assumed to be available.
-    from hoard import HoardDiarizer  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    HoardDiarizer = None  # type: ignore
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Optional
 
 from ..models import SpeakerTurn
 
@@ -20,26 +16,36 @@ class DiarizationError(RuntimeError):
     """Raised when diarization fails."""
 
 
+_turn_fields = attrgetter("start", "end", "text")
+
+
+@lru_cache()
+def _load_hoard() -> Optional[type]:
+    """Import Hoard on first use so workers that never diarize skip its dependency graph."""
+    try:
+        from hoard import HoardDiarizer  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return HoardDiarizer
+
+
 async def diarize(transcript_turns: List[SpeakerTurn], audio_path: str) -> List[SpeakerTurn]:
     """
     Perform diarization using Hoard to reassign speaker labels for each turn.
 
     Hoard expects an audio path and an initial transcript with timestamps.
+    Without Hoard the given turns are relabelled in place and returned.
     """
+    HoardDiarizer = _load_hoard()
     if HoardDiarizer is None:
         # Provide a graceful fallback for environments without Hoard.
         await asyncio.sleep(0.1)
-        # Assign pseudo speakers in round-robin fashion.
+        # Assign pseudo speakers in round-robin fashion. Only the label changes,
+        # so the existing turns are relabelled in place rather than rebuilt.
         speakers = ["Speaker 1", "Speaker 2"]
-        return [
-            SpeakerTurn(
-                speaker=speakers[index % len(speakers)],
-                start=turn.start,
-                end=turn.end,
-                text=turn.text,
-            )
-            for index, turn in enumerate(transcript_turns)
-        ]
+        for index, turn in enumerate(transcript_turns):
+            turn.speaker = speakers[index % len(speakers)]
+        return transcript_turns
 
     # -- Hoard integration start --
     # Initialize Hoard with default configuration. In production you can tune
@@ -49,12 +55,8 @@ async def diarize(transcript_turns: List[SpeakerTurn], audio_path: str) -> List[
     diarized_segments = diarizer.run(  # type: ignore[attr-defined]
         audio_path=audio_path,
         transcript=[
-            {
-                "start": turn.start,
-                "end": turn.end,
-                "text": turn.text,
-            }
-            for turn in transcript_turns
+            {"start": start, "end": end, "text": text}
+            for start, end, text in map(_turn_fields, transcript_turns)
         ],
     )
     # -- Hoard integration end --
@@ -62,8 +64,9 @@ async def diarize(transcript_turns: List[SpeakerTurn], audio_path: str) -> List[
     if not diarized_segments:
         raise DiarizationError("Hoard returned no diarization segments.")
 
+    # Hoard emits plain floats/strings, so per-turn validation is skipped.
     return [
-        SpeakerTurn(
+        SpeakerTurn.model_construct(
             speaker=segment.get("speaker", f"Speaker {index + 1}"),
             start=float(segment.get("start", 0.0)),
             end=float(segment.get("end", 0.0)),
@@ -0,0 +1,38 @@
+"""
+Shared outbound HTTP client used by provider integrations.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+_client_lock = asyncio.Lock()
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the process-wide client, creating it on first use."""
+    global _client
+    if _client is None:
+        async with _client_lock:
+            if _client is None:
+                import httpx
+
+                _client = httpx.AsyncClient(
+                    timeout=120,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                    http2=True,
+                )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client, if it was ever created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -5,14 +5,22 @@ LLM-based summarization service.
 from __future__ import annotations
 
 import asyncio
-from typing import List
+import hashlib
+from collections import OrderedDict
+from typing import List, Tuple
 
-import httpx
+import orjson
 
-from ..config import get_settings
+from ..config import SETTINGS
 from ..models import SpeakerTurn, SummaryResult, SummarySection
+from .http_client import get_client
 
-settings = get_settings()
+
+# Summaries keyed by a digest of the prompt and rendered transcript, most recently used last.
+_summary_cache: "OrderedDict[bytes, SummaryResult]" = OrderedDict()
+
+# Caps concurrent outbound provider calls across all jobs.
+_llm_slots = asyncio.Semaphore(SETTINGS.llm_concurrency)
 
 
 class SummarizationError(RuntimeError):
@@ -24,25 +32,106 @@ SUMMARY_PROMPT = """Summarize this transcript, giving per-speaker highlights and
 Return JSON with keys: overview (string), key_points (list of strings), per_speaker (list of {speaker, highlights[]}).
 """
 
+REDUCE_PROMPT = """These are summaries of consecutive parts of one podcast episode. Merge them into a single summary of the whole episode, giving per-speaker highlights and overall episode summary.
+
+Return JSON with keys: overview (string), key_points (list of strings), per_speaker (list of {speaker, highlights[]}).
+"""
+
+
+# Transcripts longer than this are formatted and chunked off the event loop.
+_THREADED_FORMAT_MIN_TURNS = 2000
+
+
+def _format_transcript(transcript_turns: List[SpeakerTurn]) -> List[str]:
+    """Render turns as ``[start-end] speaker: text`` lines for the prompt."""
+    lines = []
+    append = lines.append
+    for turn in transcript_turns:
+        append("[%.2f-%.2f] %s: %s\n" % (turn.start, turn.end, turn.speaker, turn.text))
+    return lines
+
+
+def _chunk_lines(lines: List[str]) -> List[str]:
+    """Group transcript lines into prompts of at most ``summary_chunk_chars`` characters."""
+    limit = SETTINGS.summary_chunk_chars
+    if limit <= 0 or sum(map(len, lines)) <= limit:
+        return ["".join(lines)]
+
+    chunks = []
+    start = 0
+    while start < len(lines):
+        end, size = start, 0
+        # Always take at least one line so an oversized turn still makes progress.
+        while end < len(lines) and (end == start or size + len(lines[end]) <= limit):
+            size += len(lines[end])
+            end += 1
+        chunks.append("".join(lines[start:end]))
+        if end == len(lines):
+            break
+        start = max(end - SETTINGS.summary_chunk_overlap_turns, start + 1)
+    return chunks
+
+
+def _format_partials(partials: List[SummaryResult]) -> str:
+    """Render per-chunk summaries as the input of the reduce step."""
+    lines = []
+    append = lines.append
+    for index, partial in enumerate(partials, start=1):
+        append("Part %d: %s\n" % (index, partial.overview))
+        for point in partial.key_points:
+            append("- %s\n" % point)
+        for section in partial.per_speaker:
+            for highlight in section.highlights:
+                append("%s: %s\n" % (section.speaker, highlight))
+    return "".join(lines)
+
+
+def _prepare_chunks(transcript_turns: List[SpeakerTurn]) -> List[Tuple[str, bytes]]:
+    """Render and chunk the transcript, pairing each map-step prompt with its cache key."""
+    chunks = _chunk_lines(_format_transcript(transcript_turns))
+    return [(chunk, _cache_key(SUMMARY_PROMPT, chunk)) for chunk in chunks]
+
+
+def _cache_key(prompt: str, content: str) -> bytes:
+    digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16)
+    digest.update(content.encode("utf-8"))
+    return digest.digest()
+
 
 async def summarize(transcript_turns: List[SpeakerTurn]) -> SummaryResult:
-    """Call configured LLM provider to generate a structured summary."""
+    """
+    Call configured LLM provider to generate a structured summary.
+
+    Long transcripts are split into overlapping windows that are summarized
+    concurrently, then merged by a final reduce call.
+    """
     if not transcript_turns:
         raise SummarizationError("Transcript is empty.")
 
-    content = "\n".join(
-        f"[{turn.start:.2f}-{turn.end:.2f}] {turn.speaker}: {turn.text}" for turn in transcript_turns
+    if len(transcript_turns) > _THREADED_FORMAT_MIN_TURNS:
+        chunks = await asyncio.to_thread(_prepare_chunks, transcript_turns)
+    else:
+        chunks = _prepare_chunks(transcript_turns)
+
+    if len(chunks) == 1:
+        content, cache_key = chunks[0]
+        return await _summarize_content(content, SUMMARY_PROMPT, cache_key)
+
+    partials = await asyncio.gather(
+        *(_summarize_content(content, SUMMARY_PROMPT, cache_key) for content, cache_key in chunks)
     )
+    reduce_content = _format_partials(partials)
+    return await _summarize_content(reduce_content, REDUCE_PROMPT, _cache_key(REDUCE_PROMPT, reduce_content))
 
-    provider = settings.llm_provider.lower()
-    if provider == "openai":
-        response = await _call_openai(content)
-    elif provider == "deepseek":
-        response = await _call_deepseek(content)
-    elif provider == "gemini":
-        response = await _call_gemini(content)
-    else:
-        response = await _call_custom(content)
+
+async def _summarize_content(content: str, prompt: str, cache_key: bytes) -> SummaryResult:
+    cached = _summary_cache.get(cache_key)
+    if cached is not None:
+        _summary_cache.move_to_end(cache_key)
+        return cached.model_copy(deep=True)
+
+    async with _llm_slots:
+        response = await _PROVIDERS.get(_PROVIDER_KEY, _call_custom)(content, prompt)
 
     overview = response.get("overview") or "Summary unavailable."
     key_points = response.get("key_points") or []
@@ -56,20 +145,31 @@ async def summarize(transcript_turns: List[SpeakerTurn]) -> SummaryResult:
         for item in per_speaker_data
     ]
 
-    return SummaryResult(overview=overview, key_points=key_points, per_speaker=per_speaker)
+    summary = SummaryResult(overview=overview, key_points=key_points, per_speaker=per_speaker)
+    _remember_summary(cache_key, summary)
+    return summary
+
 
+def _remember_summary(cache_key: bytes, summary: SummaryResult) -> None:
+    if SETTINGS.summary_cache_size <= 0:
+        return
+    _summary_cache[cache_key] = summary.model_copy(deep=True)
+    _summary_cache.move_to_end(cache_key)
+    while len(_summary_cache) > SETTINGS.summary_cache_size:
+        _summary_cache.popitem(last=False)
 
-async def _call_openai(content: str) -> dict:
-    if not settings.llm_api_key and not settings.openai_api_key:
+
+async def _call_openai(content: str, prompt: str) -> dict:
+    if not SETTINGS.llm_api_key and not SETTINGS.openai_api_key:
         raise SummarizationError("OpenAI API key not configured.")
-    api_key = settings.llm_api_key or settings.openai_api_key
+    api_key = SETTINGS.llm_api_key or SETTINGS.openai_api_key
 
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
     payload = {
-        "model": settings.llm_model,
+        "model": SETTINGS.llm_model,
         "response_format": {"type": "json_object"},
         "messages": [
             {"role": "system", "content": "You are an expert podcast summarizer."},
@@ -78,7 +178,7 @@ async def _call_openai(content: str) -> dict:
                 "content": [
                     {
                         "type": "text",
-                        "text": SUMMARY_PROMPT,
+                        "text": prompt,
                     },
                     {
                         "type": "text",
@@ -90,28 +190,26 @@ async def _call_openai(content: str) -> dict:
     }
 
     # -- LLM invocation start --
-    async with httpx.AsyncClient(timeout=120) as client:
-        result = await client.post(
-            "https://api.openai.com/v1/responses",
-            headers=headers,
-            json=payload,
-        )
-        result.raise_for_status()
-        data = result.json()
+    client = await get_client()
+    result = await client.post(
+        "https://api.openai.com/v1/responses",
+        headers=headers,
+        content=orjson.dumps(payload),
+    )
+    result.raise_for_status()
+    data = orjson.loads(result.content)
     # -- LLM invocation end --
 
     message = data.get("output", {}) or data.get("choices", [{}])[0].get("message", {}).get("content")
     if isinstance(message, dict):
         return message
     if isinstance(message, str):
-        import json
-
-        return json.loads(message)
+        return orjson.loads(message)
     raise SummarizationError("Unexpected OpenAI response format.")
 
 
-async def _call_deepseek(content: str) -> dict:
-    if not settings.llm_api_key:
+async def _call_deepseek(content: str, prompt: str) -> dict:
+    if not SETTINGS.llm_api_key:
         raise SummarizationError("DeepSeek API key not configured.")
 
     await asyncio.sleep(0.1)
@@ -122,7 +220,7 @@ async def _call_deepseek(content: str) -> dict:
     }
 
 
-async def _call_custom(content: str) -> dict:
+async def _call_custom(content: str, prompt: str) -> dict:
     await asyncio.sleep(0.1)
     return {
         "overview": "Custom provider not configured.",
@@ -131,17 +229,17 @@ async def _call_custom(content: str) -> dict:
     }
 
 
-async def _call_gemini(content: str) -> dict:
-    api_key = settings.gemini_api_key or settings.llm_api_key
+async def _call_gemini(content: str, prompt: str) -> dict:
+    api_key = SETTINGS.gemini_api_key or SETTINGS.llm_api_key
     if not api_key:
         raise SummarizationError("Gemini API key not configured.")
 
     endpoint = (
         "https://generativelanguage.googleapis.com/v1beta/models/"
-        f"{settings.llm_model or 'gemini-1.5-flash-latest'}:generateContent"
+        f"{SETTINGS.llm_model or 'gemini-1.5-flash-latest'}:generateContent"
     )
     params = {"key": api_key}
-    prompt_text = f"{SUMMARY_PROMPT}\n\nTranscript:\n{content}"
+    prompt_text = f"{prompt}\n\nTranscript:\n{content}"
 
     payload = {
         "contents": [
@@ -159,10 +257,15 @@ async def _call_gemini(content: str) -> dict:
     }
 
     # -- Gemini invocation start --
-    async with httpx.AsyncClient(timeout=120) as client:
-        response = await client.post(endpoint, params=params, json=payload)
-        response.raise_for_status()
-        data = response.json()
+    client = await get_client()
+    response = await client.post(
+        endpoint,
+        params=params,
+        headers={"Content-Type": "application/json"},
+        content=orjson.dumps(payload),
+    )
+    response.raise_for_status()
+    data = orjson.loads(response.content)
     # -- Gemini invocation end --
 
     try:
@@ -173,8 +276,12 @@ async def _call_gemini(content: str) -> dict:
     except (KeyError, IndexError, TypeError) as exc:
         raise SummarizationError("Unexpected Gemini response format.") from exc
 
-    import json
-
-    return json.loads(text)
+    return orjson.loads(text)
 
 
+_PROVIDERS = {
+    "openai": _call_openai,
+    "deepseek": _call_deepseek,
+    "gemini": _call_gemini,
+}
+_PROVIDER_KEY = SETTINGS.llm_provider.lower()
@@ -149,31 +149,150 @@ Processing pipeline orchestrating transcription, diarization, summarization, and
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
-from typing import Dict, Optional
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import IntEnum
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
 
 from pathlib import Path
 
+from pydantic import BaseModel
+
+from ..config import SETTINGS
 from ..models import (
     ProcessingStage,
     ProcessingStatus,
     ResultsResponse,
+    SpeakerTurn,
     SummaryResult,
     TranscriptResult,
     TTSRequest,
 )
 from . import diarization, llm, transcription, tts
-from .storage import get_job_dir as storage_get_job_dir, media_url, save_text
+from .storage import get_job_dir as storage_get_job_dir, media_url, save_json
+
+logger = logging.getLogger(__name__)
+
+
+class _Stage(IntEnum):
+    """Internal stage codes; mapped to ``ProcessingStage`` only at the API boundary."""
+
+    UPLOADED = 0
+    TRANSCRIBING = 1
+    DIARIZING = 2
+    SUMMARIZING = 3
+    TTS = 4
+    COMPLETED = 5
+    FAILED = 6
+
+
+_STAGE_NAMES: Tuple[ProcessingStage, ...] = (
+    ProcessingStage.UPLOADED,
+    ProcessingStage.TRANSCRIBING,
+    ProcessingStage.DIARIZING,
+    ProcessingStage.SUMMARIZING,
+    ProcessingStage.TTS,
+    ProcessingStage.COMPLETED,
+    ProcessingStage.FAILED,
+)
+
+
+_SNAPSHOT_NAME = "status.json"
+_TERMINAL_STAGES = (ProcessingStage.COMPLETED, ProcessingStage.FAILED)
+
+
+def _delta_ns(delta: timedelta) -> int:
+    return delta // timedelta(microseconds=1) * 1000
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """Everything tracked for one job, reachable with a single lookup."""
+
+    status: ProcessingStatus
+    url_prefix: str  # "/media/<job_id>/", built once so asset URLs are a single concat
+    stage: _Stage = _Stage.UPLOADED
+    transcript: Optional[TranscriptResult] = None
+    summary: Optional[SummaryResult] = None
+    summary_audio: Optional[str] = None
+    audio_path: Optional[str] = None
+    finished_at: Optional[float] = None  # monotonic time the job reached a terminal stage
+    # Transitions only stamp the monotonic clock; status.updated_at is derived on read.
+    created_ns: int = 0
+    updated_ns: int = 0
+    restored: bool = False  # loaded from a snapshot; outputs are read back from disk on demand
+    queued: bool = False  # admitted for processing and still waiting for a slot
+
+
+class _JobSnapshot(BaseModel):
+    """On-disk form of a job, rewritten to its results directory on every stage change."""
+
+    status: ProcessingStatus
+    audio_file: Optional[str] = None
+    summary_audio: Optional[str] = None
+    queued: bool = False
+
+
+def _write_snapshot(job_id: str, data: bytes) -> None:
+    path = storage_get_job_dir(job_id) / _SNAPSHOT_NAME
+    partial = path.with_suffix(".tmp")
+    partial.write_bytes(data)
+    # Readers never see a half-written snapshot.
+    os.replace(partial, path)
+
+
+def _read_snapshots() -> List[_JobSnapshot]:
+    """Load snapshots worth restoring, deleting those of jobs that finished past the TTL."""
+    expiry = datetime.utcnow() - timedelta(seconds=SETTINGS.job_ttl_seconds)
+    snapshots = []
+    for path in SETTINGS.results_dir.glob(f"*/{_SNAPSHOT_NAME}"):
+        try:
+            snapshot = _JobSnapshot.model_validate_json(path.read_bytes())
+        except (OSError, ValueError):
+            logger.warning("Skipping unreadable job snapshot %s", path, exc_info=True)
+            continue
+        status = snapshot.status
+        if status.stage in _TERMINAL_STAGES and status.updated_at <= expiry:
+            # Would be evicted straight away; drop it so later startups skip it too.
+            try:
+                path.unlink()
+            except OSError:
+                logger.warning("Could not delete expired job snapshot %s", path, exc_info=True)
+            continue
+        snapshots.append(snapshot)
+    return snapshots
+
+
+def _read_outputs(job_dir: Path, assets: Dict[str, str]) -> Tuple[Optional[TranscriptResult], Optional[SummaryResult]]:
+    transcript = summary = None
+    if "diarized_transcript" in assets:
+        transcript = TranscriptResult.model_validate_json((job_dir / "diarized.json").read_bytes())
+    if "summary" in assets:
+        summary = SummaryResult.model_validate_json((job_dir / "summary.json").read_bytes())
+    return transcript, summary
 
 
 class PipelineState:
-    """In-memory job tracker."""
+    """
+    In-memory job tracker.
+
+    Finished jobs are forgotten after ``job_ttl_seconds``, and the oldest
+    finished jobs are dropped first once more than ``max_tracked_jobs``
+    are tracked. Jobs that are still running are never evicted.
+
+    When ``persist_jobs`` is enabled each job also leaves a ``status.json``
+    snapshot next to its outputs, which ``restore`` reloads after a restart.
+    """
 
     def __init__(self) -> None:
-        self._jobs: Dict[str, ProcessingStatus] = {}
-        self._transcripts: Dict[str, TranscriptResult] = {}
-        self._summaries: Dict[str, SummaryResult] = {}
-        self._summary_audio: Dict[str, str] = {}
+        # Insertion-ordered, so iteration visits the oldest jobs first.
+        self._jobs: Dict[str, JobRecord] = {}
+        # Latest unwritten snapshot per job, drained by one writer task per job.
+        self._pending_snapshots: Dict[str, bytes] = {}
+        self._snapshot_writers: Dict[str, asyncio.Task] = {}
 
     def create_status(self, job_id: str) -> ProcessingStatus:
         now = datetime.utcnow()
@@ -183,98 +302,321 @@ class PipelineState:
             created_at=now,
             updated_at=now,
         )
-        self._jobs[job_id] = status
+        self._evict()
+        created_ns = time.monotonic_ns()
+        self._jobs[job_id] = JobRecord(
+            status=status,
+            url_prefix=media_url(job_id, ""),
+            created_ns=created_ns,
+            updated_ns=created_ns,
+        )
         return status
 
-    def update_stage(self, job_id: str, stage: ProcessingStage, detail: Optional[str] = None) -> None:
-        status = self._jobs[job_id]
-        status.stage = stage
+    def _evict(self, incoming: int = 1) -> None:
+        """Drop expired finished jobs, then the oldest finished ones, leaving room for ``incoming`` more."""
+        expiry = time.monotonic() - SETTINGS.job_ttl_seconds
+        finished = [job_id for job_id, record in self._jobs.items() if record.finished_at is not None]
+        for job_id in finished:
+            if self._jobs[job_id].finished_at <= expiry:
+                del self._jobs[job_id]
+
+        overflow = len(self._jobs) + incoming - SETTINGS.max_tracked_jobs
+        for job_id in finished:
+            if overflow <= 0:
+                break
+            if self._jobs.pop(job_id, None) is not None:
+                overflow -= 1
+
+    def update_stage(self, job_id: str, stage: _Stage, detail: Optional[str] = None) -> None:
+        record = self._jobs[job_id]
+        # Progress-only updates (same stage, new detail) are not worth a snapshot.
+        changed = record.stage != stage
+        record.stage = stage
+        if stage > _Stage.UPLOADED:
+            # The job holds a processing slot (or has finished), so it no longer waits.
+            record.queued = False
+        record.finished_at = time.monotonic() if stage >= _Stage.COMPLETED else None
+        status = record.status
+        status.stage = _STAGE_NAMES[stage]
         status.detail = detail
-        status.updated_at = datetime.utcnow()
+        record.updated_ns = time.monotonic_ns()
+        if changed:
+            self._persist(job_id, record)
 
     def add_error(self, job_id: str, message: str) -> None:
-        status = self._jobs[job_id]
+        record = self._jobs[job_id]
+        record.stage = _Stage.FAILED
+        record.finished_at = time.monotonic()
+        status = record.status
         status.errors.append(message)
         status.stage = ProcessingStage.FAILED
-        status.updated_at = datetime.utcnow()
+        record.updated_ns = time.monotonic_ns()
+        self._persist(job_id, record)
 
     def store_transcript(self, job_id: str, transcript: TranscriptResult) -> None:
-        self._transcripts[job_id] = transcript
+        self._jobs[job_id].transcript = transcript
 
     def store_summary(self, job_id: str, summary: SummaryResult) -> None:
-        self._summaries[job_id] = summary
+        self._jobs[job_id].summary = summary
 
     def store_summary_audio(self, job_id: str, path: str) -> None:
-        self._summary_audio[job_id] = path
+        record = self._jobs[job_id]
+        record.summary_audio = path
+        self._persist(job_id, record)
+
+    def store_audio_path(self, job_id: str, path: str) -> None:
+        record = self._jobs[job_id]
+        record.audio_path = path
+        self._persist(job_id, record)
+
+    def mark_queued(self, job_id: str) -> None:
+        record = self._jobs[job_id]
+        record.queued = True
+        # A finished job sent back for processing must not be evicted while it waits.
+        record.finished_at = None
+        self._persist(job_id, record)
+
+    def audio_path(self, job_id: str) -> Optional[str]:
+        return self._jobs[job_id].audio_path
+
+    def media_url(self, job_id: str, filename: str) -> str:
+        return self._jobs[job_id].url_prefix + filename
+
+    def add_asset(self, job_id: str, key: str, filename: str) -> None:
+        record = self._jobs[job_id]
+        record.status.assets[key] = record.url_prefix + filename
+        self._persist(job_id, record)
 
     def get(self, job_id: str) -> ProcessingStatus:
-        return self._jobs[job_id]
-
-    def results(self, job_id: str) -> ResultsResponse:
-        status = self._jobs[job_id]
-        transcript = self._transcripts.get(job_id)
-        summary = self._summaries.get(job_id)
-        audio_url = status.assets.get("source_audio")
-        summary_audio_url = self._summary_audio.get(job_id)
+        return self._synced_status(self._jobs[job_id])
+
+    @staticmethod
+    def _synced_status(record: JobRecord) -> ProcessingStatus:
+        status = record.status
+        elapsed = timedelta(microseconds=(record.updated_ns - record.created_ns) // 1000)
+        status.updated_at = status.created_at + elapsed
+        return status
+
+    async def results(self, job_id: str) -> ResultsResponse:
+        record = self._jobs[job_id]
+        if record.restored:
+            await self._load_outputs(job_id, record)
+        status = self._synced_status(record)
         return ResultsResponse(
             job_id=job_id,
             status=status,
-            transcript=transcript,
-            summary=summary,
-            audio_url=audio_url,
-            summary_audio_url=summary_audio_url,
+            transcript=record.transcript,
+            summary=record.summary,
+            audio_url=status.assets.get("source_audio"),
+            summary_audio_url=record.summary_audio,
         )
 
+    def _persist(self, job_id: str, record: JobRecord) -> None:
+        """Queue a snapshot of ``record``; the file is written off the event loop."""
+        if not SETTINGS.persist_jobs:
+            return
+        snapshot = _JobSnapshot.model_construct(
+            status=self._synced_status(record),
+            # Audio always lives in the job directory, so only its name is kept.
+            audio_file=Path(record.audio_path).name if record.audio_path else None,
+            summary_audio=record.summary_audio,
+            queued=record.queued,
+        )
+        self._pending_snapshots[job_id] = snapshot.__pydantic_serializer__.to_json(snapshot)
+        if job_id not in self._snapshot_writers:
+            self._snapshot_writers[job_id] = asyncio.create_task(self._write_snapshots(job_id))
+
+    async def _write_snapshots(self, job_id: str) -> None:
+        try:
+            # Snapshots queued while a write is in flight collapse into the latest one.
+            while (data := self._pending_snapshots.pop(job_id, None)) is not None:
+                try:
+                    await asyncio.to_thread(_write_snapshot, job_id, data)
+                except OSError:
+                    logger.warning("Could not write status snapshot for job %s", job_id, exc_info=True)
+        finally:
+            del self._snapshot_writers[job_id]
+
+    async def flush(self) -> None:
+        """Wait for every queued snapshot to reach disk."""
+        while self._snapshot_writers:
+            await asyncio.gather(*self._snapshot_writers.values())
+
+    @staticmethod
+    async def _load_outputs(job_id: str, record: JobRecord) -> None:
+        try:
+            transcript, summary = await asyncio.to_thread(
+                _read_outputs, SETTINGS.results_dir / job_id, record.status.assets
+            )
+        except (OSError, ValueError):
+            logger.warning("Could not read saved outputs for job %s", job_id, exc_info=True)
+            return
+        # The job may have been reprocessed while the files were being read.
+        if record.transcript is None:
+            record.transcript = transcript
+        if record.summary is None:
+            record.summary = summary
+        record.restored = False
+
+    async def restore(self) -> int:
+        """
+        Reload job snapshots left in ``results_dir`` by a previous run.
+
+        Jobs that were queued or mid-pipeline when the process stopped are
+        marked as failed so clients stop polling them. Returns the number of
+        jobs still tracked afterwards.
+        """
+        snapshots = await asyncio.to_thread(_read_snapshots)
+        snapshots.sort(key=lambda snapshot: snapshot.status.updated_at)
+
+        now = datetime.utcnow()
+        now_ns = time.monotonic_ns()
+        restored = []
+        interrupted = []
+        for snapshot in snapshots:
+            status = snapshot.status
+            job_id = status.job_id
+            if job_id in self._jobs:
+                continue
+            created_ns = now_ns - _delta_ns(now - status.created_at)
+            record = JobRecord(
+                status=status,
+                url_prefix=media_url(job_id, ""),
+                stage=_Stage(_STAGE_NAMES.index(status.stage)),
+                summary_audio=snapshot.summary_audio,
+                audio_path=str(SETTINGS.results_dir / job_id / snapshot.audio_file) if snapshot.audio_file else None,
+                created_ns=created_ns,
+                updated_ns=created_ns + _delta_ns(status.updated_at - status.created_at),
+                restored=True,
+            )
+            if record.stage >= _Stage.COMPLETED:
+                record.finished_at = time.monotonic() - (now - status.updated_at).total_seconds()
+            elif record.stage > _Stage.UPLOADED or snapshot.queued:
+                interrupted.append(job_id)
+            self._jobs[job_id] = record
+            restored.append(job_id)
+
+        for job_id in interrupted:
+            self.add_error(job_id, "Interrupted by a server restart.")
+        self._evict(incoming=0)
+        return sum(job_id in self._jobs for job_id in restored)
 
 pipeline_state = PipelineState()
 
 
+class PipelineBusyError(RuntimeError):
+    """Raised when no more jobs can be admitted."""
+
+
+# At most ``max_concurrent_jobs`` run at once; up to ``max_queued_jobs`` more wait their turn.
+_job_slots = asyncio.Semaphore(SETTINGS.max_concurrent_jobs)
+_admitted_jobs = 0
+# Strong references so running jobs are not garbage-collected mid-flight.
+_background_tasks: Set[asyncio.Task] = set()
+
+
+async def _collect_turns(job_id: str, turn_stream: AsyncIterator[SpeakerTurn]) -> List[SpeakerTurn]:
+    """Gather decoded turns, reporting progress while Whisper keeps decoding the remaining spans."""
+    turns: List[SpeakerTurn] = []
+    async for turn in turn_stream:
+        turns.append(turn)
+        pipeline_state.update_stage(job_id, _Stage.TRANSCRIBING, f"Transcribed {len(turns)} segments")
+    return turns
+
+
+async def _save_summary(job_id: str, summary: SummaryResult) -> None:
+    # Registers the asset as soon as the file exists, even if TTS later fails.
+    summary_path = await save_json(job_id, "summary.json", summary)
+    pipeline_state.add_asset(job_id, "summary", summary_path.name)
+
+
 async def process_job(job_id: str, audio_path: str, enable_tts: bool = False) -> ProcessingStatus:
     """Execute the sequential processing pipeline."""
-    try:
-        pipeline_state.update_stage(job_id, ProcessingStage.TRANSCRIBING, "Running transcription")
-        language, turns = await transcription.transcribe_audio(Path(audio_path))
-        transcript = TranscriptResult(language=language, turns=turns)
-        pipeline_state.store_transcript(job_id, transcript)
-        transcript_path = save_text(job_id, "transcript.json", transcript.json(indent=2))
-        pipeline_state.get(job_id).assets["transcript"] = media_url(job_id, transcript_path.name)
-
-        pipeline_state.update_stage(job_id, ProcessingStage.DIARIZING, "Applying Hoard diarization")
-        diarized_turns = await diarization.diarize(transcript.turns, audio_path)
-        transcript.turns = diarized_turns
-        diarized_path = save_text(job_id, "diarized.json", transcript.json(indent=2))
-        pipeline_state.get(job_id).assets["diarized_transcript"] = media_url(job_id, diarized_path.name)
-
-        pipeline_state.update_stage(job_id, ProcessingStage.SUMMARIZING, "Generating LLM summary")
-        summary = await llm.summarize(transcript.turns)
-        pipeline_state.store_summary(job_id, summary)
-        summary_path = save_text(job_id, "summary.json", summary.json(indent=2))
-        pipeline_state.get(job_id).assets["summary"] = media_url(job_id, summary_path.name)
-
-        if enable_tts:
-            pipeline_state.update_stage(job_id, ProcessingStage.TTS, "Synthesizing summary audio")
-            tts_request = TTSRequest(job_id=job_id, text=summary.overview)
-            summary_audio_path = await tts.synthesize_tts(tts_request)
-            pipeline_state.store_summary_audio(job_id, media_url(job_id, summary_audio_path.name))
-
-        pipeline_state.update_stage(job_id, ProcessingStage.COMPLETED, "Processing complete")
-
-    except Exception as exc:  # noqa: BLE001
-        pipeline_state.add_error(job_id, str(exc))
+    if _job_slots.locked():
+        pipeline_state.update_stage(job_id, _Stage.UPLOADED, "Waiting for a processing slot")
+    async with _job_slots:
+        try:
+            pipeline_state.update_stage(job_id, _Stage.TRANSCRIBING, "Running transcription")
+            language, turn_stream = await transcription.stream_transcription(Path(audio_path))
+            try:
+                turns = await _collect_turns(job_id, turn_stream)
+            except transcription.TranscriptionError as whisper_error:
+                # A span failed after decoding had started; redo the file with the fallback provider.
+                language, turns = await transcription.fallback_transcription(Path(audio_path), whisper_error)
+            transcript = TranscriptResult(language=language, turns=turns)
+            pipeline_state.store_transcript(job_id, transcript)
+            if SETTINGS.keep_intermediate:
+                # Superseded by diarized.json below; only written when explicitly requested.
+                transcript_path = await save_json(job_id, "transcript.json", transcript)
+                pipeline_state.add_asset(job_id, "transcript", transcript_path.name)
+
+            pipeline_state.update_stage(job_id, _Stage.DIARIZING, "Applying Hoard diarization")
+            diarized_turns = await diarization.diarize(transcript.turns, audio_path)
+            transcript.turns = diarized_turns
+            diarized_path = await save_json(job_id, "diarized.json", transcript)
+            pipeline_state.add_asset(job_id, "diarized_transcript", diarized_path.name)
+
+            pipeline_state.update_stage(job_id, _Stage.SUMMARIZING, "Generating LLM summary")
+            summary = await llm.summarize(transcript.turns)
+            pipeline_state.store_summary(job_id, summary)
+
+            if enable_tts:
+                pipeline_state.update_stage(job_id, _Stage.TTS, "Synthesizing summary audio")
+                tts_request = TTSRequest(job_id=job_id, text=summary.overview)
+                # The summary write and the TTS round-trip are independent, so overlap them.
+                outcomes = await asyncio.gather(
+                    _save_summary(job_id, summary), tts.synthesize_tts(tts_request), return_exceptions=True
+                )
+                # Fail only once both have settled, so the summary asset is recorded first.
+                for outcome in outcomes:
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+                summary_audio_path = outcomes[1]
+                pipeline_state.store_summary_audio(job_id, pipeline_state.media_url(job_id, summary_audio_path.name))
+            else:
+                await _save_summary(job_id, summary)
+
+            pipeline_state.update_stage(job_id, _Stage.COMPLETED, "Processing complete")
+
+        except Exception as exc:  # noqa: BLE001
+            pipeline_state.add_error(job_id, str(exc))
 
     return pipeline_state.get(job_id)
 
 
+def admit_job(job_id: str) -> None:
+    """Reserve a place for a new job, refusing once the backlog is full."""
+    global _admitted_jobs
+    if _admitted_jobs >= SETTINGS.max_concurrent_jobs + SETTINGS.max_queued_jobs:
+        raise PipelineBusyError("Server is at capacity; retry shortly.")
+    _admitted_jobs += 1
+    pipeline_state.mark_queued(job_id)
+
+
+async def _run_admitted(job_id: str, audio_path: str, enable_tts: bool) -> None:
+    global _admitted_jobs
+    try:
+        await process_job(job_id, audio_path, enable_tts)
+    finally:
+        _admitted_jobs -= 1
+
+
 async def launch_background(job_id: str, audio_path: str, enable_tts: bool = False) -> None:
-    """Spawn background task for processing."""
-    asyncio.create_task(process_job(job_id, audio_path, enable_tts))
+    """Spawn background task for a job previously reserved with ``admit_job``."""
+    task = asyncio.create_task(_run_admitted(job_id, audio_path, enable_tts))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
 
 def register_audio_asset(job_id: str, asset_path: str) -> None:
     """Store path to uploaded audio."""
-    status = pipeline_state.get(job_id)
-    filename = Path(asset_path).name
-    status.assets["source_audio"] = media_url(job_id, filename)
+    pipeline_state.add_asset(job_id, "source_audio", Path(asset_path).name)
+    pipeline_state.store_audio_path(job_id, asset_path)
+
+
+def get_audio_path(job_id: str) -> Optional[str]:
+    """Return the registered source audio path, or None if not yet available."""
+    return pipeline_state.audio_path(job_id)
 
 
 def ensure_job(job_id: str) -> ProcessingStatus:
@@ -2,15 +2,22 @@
 Utilities for persisting uploaded audio, transcripts, and summaries.
 """
 
+import asyncio
+import io
+import os
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Tuple
+from typing import AsyncIterator, BinaryIO, Optional, Tuple
 from uuid import uuid4
 
+import aiofiles
 from fastapi import UploadFile
+from pydantic import BaseModel
 
-from ..config import get_settings
+from ..config import SETTINGS
 
-settings = get_settings()
+_COPY_BLOCK = 4 * 1024 * 1024
 
 
 def generate_job_id() -> str:
@@ -18,7 +25,7 @@ def generate_job_id() -> str:
 
 
 def get_job_dir(job_id: str) -> Path:
-    job_dir = settings.results_dir / job_id
+    job_dir = SETTINGS.results_dir / job_id
     job_dir.mkdir(parents=True, exist_ok=True)
     return job_dir
 
@@ -34,26 +41,65 @@ async def save_upload(job_id: str, file: UploadFile) -> Tuple[Path, str]:
     suffix = Path(file.filename or "audio").suffix or ".mp3"
     dest_path = job_dir / f"source{suffix}"
 
-    with dest_path.open("wb") as buffer:
-        while chunk := await file.read(1024 * 1024):
-            buffer.write(chunk)
+    await asyncio.to_thread(_copy_upload, file.file, dest_path)
 
     return dest_path, dest_path.name
 
 
-def save_text(job_id: str, name: str, content: str) -> Path:
-    """Persist textual content to disk."""
+def _copy_upload(source: BinaryIO, dest_path: Path) -> None:
+    """Copy an upload spool to disk, kernel-side when it has already spilled to a real file."""
+    source.seek(0)
+    src_fd = _disk_fileno(source)
+    with dest_path.open("wb") as buffer:
+        if src_fd is not None:
+            try:
+                _sendfile(src_fd, buffer.fileno())
+                return
+            except OSError:
+                source.seek(0)
+                buffer.seek(0)
+                buffer.truncate()
+        shutil.copyfileobj(source, buffer, _COPY_BLOCK)
+
+
+def _disk_fileno(source: BinaryIO) -> Optional[int]:
+    """Return the descriptor behind an upload, or None while it is still held in memory."""
+    # SpooledTemporaryFile.fileno() forces a rollover to disk, and there is no public
+    # way to ask whether it already rolled, so peek at the private buffer it wraps.
+    if isinstance(source, tempfile.SpooledTemporaryFile) and isinstance(source._file, io.BytesIO):
+        return None
+    try:
+        return source.fileno()
+    except (AttributeError, OSError):
+        return None
+
+
+def _sendfile(src_fd: int, dst_fd: int) -> None:
+    offset = 0
+    while sent := os.sendfile(dst_fd, src_fd, offset, _COPY_BLOCK):
+        offset += sent
+
+
+async def save_json(job_id: str, name: str, model: BaseModel) -> Path:
+    """Persist a model as indented JSON, writing the serializer's bytes as-is."""
+    data = model.__pydantic_serializer__.to_json(model, indent=2)
+    return await save_binary(job_id, name, data)
+
+
+async def save_binary(job_id: str, name: str, data: bytes) -> Path:
+    """Persist binary content."""
     job_dir = get_job_dir(job_id)
     path = job_dir / name
-    path.write_text(content, encoding="utf-8")
+    async with aiofiles.open(path, "wb") as buffer:
+        await buffer.write(data)
     return path
 
 
-def save_binary(job_id: str, name: str, data: bytes) -> Path:
-    """Persist binary content."""
+async def save_stream(job_id: str, name: str, chunks: AsyncIterator[bytes]) -> Path:
+    """Persist binary content as it arrives, without buffering it in memory."""
     job_dir = get_job_dir(job_id)
     path = job_dir / name
-    path.write_bytes(data)
+    async with aiofiles.open(path, "wb") as buffer:
+        async for chunk in chunks:
+            await buffer.write(chunk)
     return path
-
-
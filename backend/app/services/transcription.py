@@ -5,93 +5,229 @@ Transcription service integrating Whisper (primary) with optional fallbacks.
 from __future__ import annotations
 
 import asyncio
+import os
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Tuple
-from faster_whisper import WhisperModel
+from typing import TYPE_CHECKING, AsyncIterator, Deque, Iterator, List, Optional, Tuple
 
+from ..config import SETTINGS
+from ..models import SpeakerTurn
 
-import httpx
+if TYPE_CHECKING:
+    import numpy as np
+    from faster_whisper import WhisperModel
 
-from ..config import get_settings
-from ..models import SpeakerTurn
+_SAMPLE_RATE = 16000
 
-settings = get_settings()
+_model: Optional[WhisperModel] = None
+_model_lock = asyncio.Lock()
+# One slot per CTranslate2 worker, shared by every job using the model.
+# Resized in get_model() once the number of model replicas is known.
+_decode_capacity = SETTINGS.whisper_workers
+_decode_slots = asyncio.Semaphore(_decode_capacity)
 
 
 class TranscriptionError(RuntimeError):
     """Raised when transcription fails."""
 
 
-async def transcribe_audio(audio_path: Path) -> Tuple[str, List[SpeakerTurn]]:
+def _resolve_device() -> Tuple[str, List[int]]:
+    """Map ``whisper_device`` to a CTranslate2 device and the device indices to load replicas on."""
+    device = SETTINGS.whisper_device
+    if device not in ("auto", "cuda"):
+        return device, [0]
+
+    import ctranslate2
+
+    gpus = ctranslate2.get_cuda_device_count()
+    if gpus == 0:
+        if device == "cuda":
+            raise TranscriptionError("WHISPER_DEVICE=cuda but no CUDA device is visible.")
+        return "cpu", [0]
+    return "cuda", list(range(gpus))
+
+
+async def get_model() -> WhisperModel:
+    """Return the shared Whisper model, loading it on first use."""
+    global _model, _decode_capacity, _decode_slots
+    if _model is None:
+        async with _model_lock:
+            if _model is None:
+                from faster_whisper import WhisperModel
+
+                device, device_index = _resolve_device()
+                compute_type = SETTINGS.whisper_compute_type or ("int8" if device == "cpu" else "float16")
+                _model = await asyncio.to_thread(
+                    WhisperModel,
+                    SETTINGS.whisper_model,
+                    device=device,
+                    device_index=device_index,
+                    compute_type=compute_type,
+                    cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+                    num_workers=SETTINGS.whisper_workers,
+                )
+                # CTranslate2 runs num_workers decodes on each device it was given.
+                _decode_capacity = SETTINGS.whisper_workers * len(device_index)
+                _decode_slots = asyncio.Semaphore(_decode_capacity)
+    return _model
+
+
+async def stream_transcription(audio_path: Path) -> Tuple[str, AsyncIterator[SpeakerTurn]]:
     """
-    Transcribe the provided audio file and return (language, turns).
+    Start transcribing and return (language, turns), yielding turns as they are decoded.
 
-    This function first attempts to use OpenAI Whisper. If Whisper fails,
-    it will try the configured fallback provider.
+    If Whisper fails to start, the fallback provider's complete transcript is
+    replayed through the same iterator. A span that fails after that raises
+    ``TranscriptionError`` from the iterator; callers that want the fallback
+    to cover that case pass the error to ``fallback_transcription``, as
+    ``pipeline.process_job`` does.
     """
     try:
         return await _transcribe_with_whisper(audio_path)
     except Exception as whisper_error:  # noqa: BLE001
-        if settings.transcription_provider == "openai":
-            raise TranscriptionError(f"Whisper transcription failed: {whisper_error}") from whisper_error
+        language, turns = await fallback_transcription(audio_path, whisper_error)
+        return language, _replay(turns)
 
-        if settings.transcription_provider == "assemblyai":
-            return await _transcribe_with_assembly_ai(audio_path)
 
-        if settings.transcription_provider == "google":
-            return await _transcribe_with_google(audio_path)
+async def fallback_transcription(audio_path: Path, whisper_error: Exception) -> Tuple[str, List[SpeakerTurn]]:
+    """Transcribe the whole file with the configured fallback provider after Whisper failed."""
+    if SETTINGS.transcription_provider == "openai":
+        if isinstance(whisper_error, TranscriptionError):
+            raise whisper_error
+        raise TranscriptionError(f"Whisper transcription failed: {whisper_error}") from whisper_error
 
-        raise TranscriptionError("Unsupported transcription provider configured.") from whisper_error
+    if SETTINGS.transcription_provider == "assemblyai":
+        return await _transcribe_with_assembly_ai(audio_path)
 
+    if SETTINGS.transcription_provider == "google":
+        return await _transcribe_with_google(audio_path)
+
+    raise TranscriptionError("Unsupported transcription provider configured.") from whisper_error
 
-async def _transcribe_with_whisper(audio_path: Path) -> Tuple[str, List[SpeakerTurn]]:
-    """
-    Local transcription using faster-whisper (no OpenAI API required).
-    """
-    # Load Whisper model locally (choose "small" or "medium")
-    model = WhisperModel("small", device="cpu")  # change to "medium" for higher accuracy if you have resources
-
-    # Transcribe audio file (faster-whisper returns segments and an info object)
-    segments, info = model.transcribe(str(audio_path), beam_size=5)
-
-    language = getattr(info, "language", "en")
-    turns: List[SpeakerTurn] = []
-
-    for seg in segments:
-        turns.append(
-            SpeakerTurn(
-                speaker="unknown",
-                start=seg.start,
-                end=seg.end,
-                text=seg.text.strip(),
-            )
-        )
 
-    return language, turns
+async def _replay(turns: List[SpeakerTurn]) -> AsyncIterator[SpeakerTurn]:
+    for turn in turns:
+        yield turn
 
 
+def _speech_spans(audio_path: str) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+    """Decode audio and group Silero VAD speech regions into ~``whisper_chunk_seconds`` spans."""
+    from faster_whisper.audio import decode_audio
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
 
-    # -- Whisper integration end --
+    audio = decode_audio(audio_path, sampling_rate=_SAMPLE_RATE)
+    speech = get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=500))
 
-    language = payload.get("language", "en")
-    segments = payload.get("segments", [])
-    if not segments:
-        raise TranscriptionError("Whisper returned no segments.")
+    max_samples = SETTINGS.whisper_chunk_seconds * _SAMPLE_RATE
+    spans: List[Tuple[int, int]] = []
+    for region in speech:
+        if spans and region["end"] - spans[-1][0] <= max_samples:
+            spans[-1] = (spans[-1][0], region["end"])
+        else:
+            spans.append((region["start"], region["end"]))
+    return audio, spans
 
+
+def _transcribe_span(
+    model: WhisperModel, audio: np.ndarray, start: int, end: int, language: Optional[str]
+) -> Tuple[str, List[SpeakerTurn]]:
+    """Decode one span (blocking); segment times are shifted back to the full recording."""
+    offset = start / _SAMPLE_RATE
+    segments, info = model.transcribe(
+        audio[start:end],
+        language=language,
+        beam_size=5,
+        vad_filter=True,
+        vad_parameters={"min_silence_duration_ms": 500},
+    )
     turns = [
         SpeakerTurn(
             speaker="unknown",
-            start=segment.get("start", 0.0),
-            end=segment.get("end", segment.get("start", 0.0)),
-            text=segment.get("text", "").strip(),
+            start=seg.start + offset,
+            end=seg.end + offset,
+            text=seg.text.strip(),
         )
-        for segment in segments
+        for seg in segments
     ]
-    return language, turns
+    return getattr(info, "language", "en"), turns
+
+
+async def _decode_span(
+    model: WhisperModel, audio: np.ndarray, span: Tuple[int, int], language: Optional[str] = None
+) -> Tuple[str, List[SpeakerTurn]]:
+    async with _decode_slots:
+        return await asyncio.to_thread(_transcribe_span, model, audio, span[0], span[1], language)
+
+
+def _schedule_spans(
+    model: WhisperModel,
+    audio: np.ndarray,
+    language: str,
+    upcoming: Iterator[Tuple[int, int]],
+    pending: Deque[asyncio.Task],
+) -> None:
+    """Top up a job's in-flight spans to the number of decode slots."""
+    while len(pending) < _decode_capacity:
+        span = next(upcoming, None)
+        if span is None:
+            return
+        pending.append(asyncio.create_task(_decode_span(model, audio, span, language)))
+
+
+async def _span_turns(
+    model: WhisperModel,
+    audio: np.ndarray,
+    language: str,
+    first: List[SpeakerTurn],
+    upcoming: Iterator[Tuple[int, int]],
+    pending: Deque[asyncio.Task],
+) -> AsyncIterator[SpeakerTurn]:
+    """
+    Yield turns in recording order as each span finishes decoding.
+
+    A job only keeps as many spans in flight as there are decode slots, so
+    concurrent jobs take turns on the slots instead of queueing behind every
+    span of whichever job started first.
+    """
+    try:
+        for turn in first:
+            yield turn
+        while pending:
+            task = pending.popleft()
+            try:
+                _, turns = await task
+            except Exception as exc:  # noqa: BLE001
+                raise TranscriptionError(f"Whisper transcription failed: {exc}") from exc
+            _schedule_spans(model, audio, language, upcoming, pending)
+            for turn in turns:
+                yield turn
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _transcribe_with_whisper(audio_path: Path) -> Tuple[str, AsyncIterator[SpeakerTurn]]:
+    """
+    Local transcription using faster-whisper (no OpenAI API required).
+
+    The recording is split on speech boundaries. The first span fixes the
+    language; the remaining spans are then decoded concurrently (up to
+    ``whisper_workers`` at a time per device) by the shared model.
+    """
+    model = await get_model()
+    audio, spans = await asyncio.to_thread(_speech_spans, str(audio_path))
+    if not spans:
+        return "en", _replay([])
+
+    language, first = await _decode_span(model, audio, spans[0])
+    upcoming = iter(spans[1:])
+    pending: Deque[asyncio.Task] = deque()
+    _schedule_spans(model, audio, language, upcoming, pending)
+    return language, _span_turns(model, audio, language, first, upcoming, pending)
 
 
 async def _transcribe_with_assembly_ai(audio_path: Path) -> Tuple[str, List[SpeakerTurn]]:
-    if not settings.assembly_ai_key:
+    if not SETTINGS.assembly_ai_key:
         raise TranscriptionError("AssemblyAI key not configured.")
 
     # Placeholder for actual AssemblyAI transcription logic.
@@ -102,7 +238,7 @@ async def _transcribe_with_assembly_ai(audio_path: Path) -> Tuple[str, List[Spea
 
 
 async def _transcribe_with_google(audio_path: Path) -> Tuple[str, List[SpeakerTurn]]:
-    if not settings.google_credentials_json:
+    if not SETTINGS.google_credentials_json:
         raise TranscriptionError("Google Speech credentials not configured.")
 
     # Placeholder for actual Google Cloud Speech-To-Text logic.
@@ -84,31 +84,33 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
-import httpx
-
-from ..config import get_settings
+from ..config import SETTINGS
 from ..models import TTSRequest
-from .storage import save_binary
-
-settings = get_settings()
+from .http_client import get_client
+from .storage import save_binary, save_stream
 
 
 class TTSError(RuntimeError):
     """Raised when TTS fails."""
 
 
+# Caps concurrent outbound synthesis calls across all jobs.
+_tts_slots = asyncio.Semaphore(SETTINGS.tts_concurrency)
+
+
 async def synthesize_tts(request: TTSRequest) -> Path:
     """Generate an audio rendition of the summary text."""
-    provider = settings.tts_provider.lower()
-
-    if provider == "azure":
-        return await _synthesize_azure(request)
-    if provider == "google":
-        return await _synthesize_google(request)
-    if provider == "coqui":
-        return await _synthesize_coqui(request)
-    if provider == "elevenlabs":
-        return await _synthesize_elevenlabs(request)
+    provider = SETTINGS.tts_provider.lower()
+
+    async with _tts_slots:
+        if provider == "azure":
+            return await _synthesize_azure(request)
+        if provider == "google":
+            return await _synthesize_google(request)
+        if provider == "coqui":
+            return await _synthesize_coqui(request)
+        if provider == "elevenlabs":
+            return await _synthesize_elevenlabs(request)
 
     raise TTSError("TTS provider not configured or unsupported.")
 
@@ -117,10 +119,10 @@ async def synthesize_tts(request: TTSRequest) -> Path:
 # Azure TTS (Existing)
 # ------------------------------
 async def _synthesize_azure(request: TTSRequest) -> Path:
-    if not settings.azure_speech_key or not settings.azure_speech_region:
+    if not SETTINGS.azure_speech_key or not SETTINGS.azure_speech_region:
         raise TTSError("Azure Speech credentials are missing.")
 
-    voice = request.voice or settings.tts_voice
+    voice = request.voice or SETTINGS.tts_voice
     ssml = f"""
 <speak version="1.0" xml:lang="en-US">
   <voice name="{voice}">
@@ -130,20 +132,18 @@ async def _synthesize_azure(request: TTSRequest) -> Path:
 """
 
     headers = {
-        "Ocp-Apim-Subscription-Key": settings.azure_speech_key,
+        "Ocp-Apim-Subscription-Key": SETTINGS.azure_speech_key,
         "Content-Type": "application/ssml+xml",
         "X-Microsoft-OutputFormat": "audio-24khz-48kbitrate-mono-mp3",
         "User-Agent": "PodSummarize",
     }
 
-    url = f"https://{settings.azure_speech_region}.tts.speech.microsoft.com/cognitiveservices/v1"
+    url = f"https://{SETTINGS.azure_speech_region}.tts.speech.microsoft.com/cognitiveservices/v1"
 
-    async with httpx.AsyncClient(timeout=120) as client:
-        response = await client.post(url, headers=headers, content=ssml.encode("utf-8"))
+    client = await get_client()
+    async with client.stream("POST", url, headers=headers, content=ssml.encode("utf-8")) as response:
         response.raise_for_status()
-        audio_bytes = response.content
-
-    return save_binary(request.job_id, "summary.mp3", audio_bytes)
+        return await save_stream(request.job_id, "summary.mp3", response.aiter_bytes(64 * 1024))
 
 
 # ------------------------------
@@ -152,7 +152,7 @@ async def _synthesize_azure(request: TTSRequest) -> Path:
 async def _synthesize_google(request: TTSRequest) -> Path:
     await asyncio.sleep(0.1)
     dummy_audio = b""
-    return save_binary(request.job_id, "summary.mp3", dummy_audio)
+    return await save_binary(request.job_id, "summary.mp3", dummy_audio)
 
 
 # ------------------------------
@@ -161,7 +161,7 @@ async def _synthesize_google(request: TTSRequest) -> Path:
 async def _synthesize_coqui(request: TTSRequest) -> Path:
     await asyncio.sleep(0.1)
     dummy_audio = b""
-    return save_binary(request.job_id, "summary.mp3", dummy_audio)
+    return await save_binary(request.job_id, "summary.mp3", dummy_audio)
 
 
 # ------------------------------
@@ -169,15 +169,15 @@ async def _synthesize_coqui(request: TTSRequest) -> Path:
 # ------------------------------
 async def _synthesize_elevenlabs(request: TTSRequest) -> Path:
     """ElevenLabs text-to-speech integration."""
-    if not settings.elevenlabs_api_key:
+    if not SETTINGS.elevenlabs_api_key:
         raise TTSError("ElevenLabs API key missing.")
 
-    voice_id = request.voice or settings.elevenlabs_voice or "EXAVITQu4vr4xnSDxMaL"
+    voice_id = request.voice or SETTINGS.elevenlabs_voice or "EXAVITQu4vr4xnSDxMaL"
 
     url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
 
     headers = {
-        "xi-api-key": settings.elevenlabs_api_key,
+        "xi-api-key": SETTINGS.elevenlabs_api_key,
         "Content-Type": "application/json",
     }
 
@@ -187,11 +187,10 @@ async def _synthesize_elevenlabs(request: TTSRequest) -> Path:
         "model_id": "eleven_turbo_v2",
     }
 
-    async with httpx.AsyncClient(timeout=120) as client:
-        response = await client.post(url, json=payload, headers=headers)
+    client = await get_client()
+    async with client.stream("POST", url, json=payload, headers=headers) as response:
         if response.status_code != 200:
+            await response.aread()
             raise TTSError(f"ElevenLabs TTS failed: {response.text}")
 
-        audio_bytes = response.content
-
-    return save_binary(request.job_id, "summary.mp3", audio_bytes)
+        return await save_stream(request.job_id, "summary.mp3", response.aiter_bytes(64 * 1024))